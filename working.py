@@ -13,125 +13,349 @@ Recomendações: para pastas grandes, atente-se ao tamanho da imagem/WAV gerados
 """
 import io
 import math
+import mmap
 import json
+import re
+import struct
 import zlib
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import tkinter as tk
-from tkinter import filedialog, messagebox
 import numpy as np
-from PIL import Image
-import wave
 import os
-import shutil
-import tempfile
+# tkinter, PIL, wave and numba are imported inside the functions that use them,
+# so importing encode_file does not pay for the GUI or the JIT
+try:
+    import zstandard
+except ImportError:  # optional: without zstandard only zlib is available
+    zstandard = None
+
+# 256-entry table: byte -> two ASCII hex digits
+HEX = np.frombuffer(b''.join(f'{i:02x}'.encode() for i in range(256)), dtype='|S2')
+# same table viewed as uint16, so both digits of a channel go out in one store
+HEX16 = HEX.view(np.uint16)
+HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+
+def _fmt_hex_py(px_flat, digits, out):
+    # flat 1D layout on both sides: 3 input bytes -> 8 bytes "#rrggbb\n"
+    for i in range(px_flat.size // 3):
+        base = i * 8
+        out[base] = 35  # '#'
+        for c in range(3):
+            v = px_flat[i * 3 + c]
+            out[base + 1 + 2 * c] = digits[v >> 4]
+            out[base + 2 + 2 * c] = digits[v & 0xF]
+        out[base + 7] = 10  # '\n'
+
+_fmt_hex = None  # compiled on first use; False = numba not available
+
+def hex_kernel():
+    """Return _fmt_hex_py compiled with numba (lazily), or None if numba is not installed."""
+    global _fmt_hex
+    if _fmt_hex is None:
+        try:
+            from numba import njit
+        except ImportError:  # optional: without numba the hex path uses the NumPy HEX16 table
+            _fmt_hex = False
+        else:
+            # no parallel=True: a parallel kernel launched off the main thread hangs
+            # the interpreter at exit (TBB layer); each call is a single block and
+            # the writers already run concurrently
+            _fmt_hex = njit(cache=True, nogil=True)(_fmt_hex_py)
+    return _fmt_hex or None
 
 # -----------------------
 # UTILS
 # -----------------------
+CHUNK = 1 << 20
+ENCODE_CHUNK = 1 << 22
+WIDTH_ALIGN = 64  # PNG width is always a multiple of 64 pixels
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+ZLIB_CHUNK = 1 << 16
+COMPRESSED_SUFFIXES = {'.png', '.jpg', '.zip', '.gz', '.mp4', '.mp3', '.zst'}
+COMPRESSED_MAGIC = re.compile(rb'''
+      \x89PNG                # png
+    | \xff\xd8\xff           # jpeg
+    | PK\x03\x04             # zip
+    | \x1f\x8b               # gzip
+    | \x28\xb5\x2f\xfd       # zstd
+    | 7z\xbc\xaf\x27\x1c     # 7z
+    | \xfd7zXZ\x00           # xz
+    | BZh[1-9]1AY&SY         # bzip2 (block size + block magic)
+    | Rar!                   # rar
+    | ID3[\x00-\x04]         # mp3 (ID3v2 + version byte)
+    | OggS                   # ogg
+''', re.VERBOSE)
+
 def get_safe_output_folder():
     base = Path.home() / "Pictures" / "AudioGameConverter"
     base.mkdir(parents=True, exist_ok=True)
     return base
 
-def zip_folder(folder_path: Path) -> Path:
-    """Zip the folder into a temporary file and return path to zip."""
-    tmp = Path(tempfile.mkdtemp())
-    zip_path = tmp / (folder_path.name + ".zip")
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+def zip_folder(folder_path: Path) -> memoryview:
+    """Zip the folder in memory and return the zip bytes (no temp file)."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
         for p in folder_path.rglob("*"):
-            zf.write(p, p.relative_to(folder_path))
-    return zip_path
+            # already-compressed formats: deflating again only burns CPU
+            ctype = zipfile.ZIP_STORED if p.suffix.lower() in COMPRESSED_SUFFIXES else zipfile.ZIP_DEFLATED
+            zf.write(p, p.relative_to(folder_path), compress_type=ctype)
+    return buf.getbuffer()
 
 # -----------------------
 # CORE: bytes <-> pixels
 # -----------------------
 def bytes_to_pixels(data: bytes):
-    pad = (-len(data)) % 3
-    if pad:
-        data = data + b'\x00' * pad
-    arr = np.frombuffer(data, dtype=np.uint8)
-    pixels = arr.reshape((-1, 3))
-    return pixels, pad
+    n = len(data)
+    pad = (-n) % 3
+    if not pad:
+        # no padding: view the buffer directly, no copy
+        return np.frombuffer(data, dtype=np.uint8).reshape((-1, 3)), pad
+    arr = np.empty(n + pad, dtype=np.uint8)
+    arr[:n] = np.frombuffer(data, dtype=np.uint8)
+    arr[n:] = 0
+    return arr.reshape((-1, 3)), pad
+
+def pixel_planes(pixels: np.ndarray):
+    """Interleaved (N,3) -> contiguous R, G, B planes (a single transpose)."""
+    planes = np.ascontiguousarray(pixels.T, dtype=np.uint8)
+    return planes[0], planes[1], planes[2]
 
 def pixels_to_bytes(pixels: np.ndarray, pad: int):
-    b = pixels.astype(np.uint8).tobytes()
+    b = np.ascontiguousarray(pixels, dtype=np.uint8).tobytes()
     if pad:
         return b[:-pad]
     return b
 
-def pixels_to_image_file(pixels: np.ndarray, out_path: Path, width: int = None):
-    n = pixels.shape[0]
-    if width is None:
-        width = int(math.ceil(math.sqrt(n)))
-    height = int(math.ceil(n / width))
-    canvas = np.zeros((height * width, 3), dtype=np.uint8)
-    canvas[:n, :] = pixels
-    canvas = canvas.reshape((height, width, 3))
-    img = Image.fromarray(canvas, mode="RGB")
-    img.save(out_path, format="PNG")
+def image_size(n: int):
+    """Image dimensions (width, height) for n pixels."""
+    width = max(1, int(math.ceil(math.sqrt(n))))
+    width = -(-width // WIDTH_ALIGN) * WIDTH_ALIGN
+    # PNG needs height >= 1: an empty payload becomes one row of zeros
+    height = max(1, int(math.ceil(n / width)))
     return width, height
 
+def write_png_chunk(f, typ: bytes, data: bytes):
+    """Write one PNG chunk (length, type, data, CRC) without concatenating the data."""
+    # zlib.crc32 is already hardware accelerated; the type seeds the CRC
+    crc = zlib.crc32(data, zlib.crc32(typ)) & 0xffffffff
+    f.write(struct.pack('>I', len(data)) + typ)
+    f.write(data)
+    f.write(struct.pack('>I', crc))
+
+def png_scanlines(flat: np.ndarray, width: int):
+    """RGB bytes -> scanlines prefixed with filter byte 0; zero-fills the last row."""
+    row = width * 3
+    full, rem = divmod(flat.size, row)
+    rows = np.empty((full + (1 if rem else 0), row + 1), dtype=np.uint8)
+    rows[:, 0] = 0
+    rows[:full, 1:] = flat[:full * row].reshape((full, row))
+    if rem:
+        rows[full, 1:1 + rem] = flat[full * row:]
+        rows[full, 1 + rem:] = 0
+    return rows
+
 def image_file_to_pixels(img_path: Path):
+    from PIL import Image
     img = Image.open(img_path).convert("RGB")
-    arr = np.array(img, dtype=np.uint8)
+    arr = np.asarray(img, dtype=np.uint8)
     h, w, _ = arr.shape
     flat = arr.reshape((-1, 3))
     return flat, w, h
 
 def pixels_to_hex_lines(pixels: np.ndarray):
-    return ['#{:02x}{:02x}{:02x}'.format(r,g,b) for (r,g,b) in pixels.tolist()]
+    n = pixels.shape[0]
+    out = np.empty((n, 8), dtype=np.uint8)
+    kernel = hex_kernel()
+    if kernel is not None:
+        kernel(np.ascontiguousarray(pixels, dtype=np.uint8).reshape(-1), HEX_DIGITS, out.reshape(-1))
+    else:
+        out[:, 0] = 35  # '#'
+        for c, plane in enumerate(pixel_planes(pixels)):
+            out[:, 1 + 2 * c:3 + 2 * c].view(np.uint16)[:, 0] = HEX16[plane]
+        out[:, 7] = 10  # '\n'
+    # no trailing '\n', same as the old "\n".join(...)
+    return out.reshape(-1)[:-1].tobytes()
+
+# -----------------------
+# CODECS
+# -----------------------
+def looks_compressed(data) -> bool:
+    """Detect already-compressed formats by their magic number."""
+    return COMPRESSED_MAGIC.match(bytes(data[:16])) is not None
+
+def zlib_compress(data) -> bytes:
+    """Level-1 zlib fed in ZLIB_CHUNK blocks."""
+    co = zlib.compressobj(1, zlib.DEFLATED, 15, 9, zlib.Z_DEFAULT_STRATEGY)
+    with memoryview(data) as mv:
+        out = [co.compress(mv[i:i + ZLIB_CHUNK]) for i in range(0, len(mv), ZLIB_CHUNK)]
+    out.append(co.flush())
+    return b''.join(out)
+
+def zstd_compress(data) -> memoryview:
+    """Compress with zstd, streaming the input in CHUNK blocks.
+
+    Returns a view of the output buffer, so the compressed bytes are not copied again.
+    """
+    if zstandard is None:
+        raise RuntimeError("zstd needs the 'zstandard' package (pip install zstandard)")
+    out = io.BytesIO()
+    cctx = zstandard.ZstdCompressor(level=3)
+    # size= stores the content size in the frame, which ZstdDecompressor().decompress needs
+    with memoryview(data) as mv, cctx.stream_writer(out, size=len(mv), closefd=False) as w:
+        for i in range(0, len(mv), CHUNK):
+            w.write(mv[i:i + CHUNK])
+    return out.getbuffer()
+
+def meta_codec(meta: dict) -> str:
+    """Payload codec; older meta files only have the zlib_used flag."""
+    if "codec" in meta:
+        return meta["codec"]
+    return "zlib" if meta.get("zlib_used", False) else "none"
+
+def decompress(raw: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Este arquivo usa zstd: instale o pacote 'zstandard'")
+        return zstandard.ZstdDecompressor().decompress(raw)
+    if codec == "zlib":
+        return zlib.decompress(raw)
+    return raw
 
 # -----------------------
 # ENCODE / DECODE
 # -----------------------
 def prepare_input(path: Path):
-    """If path is folder, zip it; return (data_bytes, is_zip, temp_zip_path_or_None)."""
-    if path.is_dir():
-        zip_path = zip_folder(path)
-        data = zip_path.read_bytes()
-        return data, True, zip_path
-    else:
-        return path.read_bytes(), False, None
-
-def encode_file(path: Path, out_folder: Path, use_zlib: bool = False):
-    orig_name = path.name
-    data, was_zipped, zip_temp = prepare_input(path)
-    used_zlib = False
-    if use_zlib:
-        comp = zlib.compress(data)
-        if len(comp) < len(data):
-            data = comp
-            used_zlib = True
-    pixels, pad = bytes_to_pixels(data)
-
-    base = out_folder / (path.stem)
-    base.mkdir(parents=True, exist_ok=True)
-
-    img_path = base / (path.stem + "_colors.png")
-    hex_path = base / (path.stem + "_colors.txt")
-    wav_path = base / (path.stem + "_audio.wav")
-    meta_path = base / (path.stem + ".meta.json")
-
-    w,h = pixels_to_image_file(pixels, img_path)
-    hex_lines = pixels_to_hex_lines(pixels)
-    hex_path.write_text("\n".join(hex_lines), encoding='utf-8')
+    """If path is folder, zip it in memory; return (data, is_zip).
 
+    Files are memory-mapped read-only instead of read whole; the caller closes the mmap.
+    """
+    if path.is_dir():
+        return zip_folder(path), True
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b'', False  # mmap rejects empty files
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), False
+
+def iter_pixel_blocks(mv: memoryview, step: int):
+    """Walk the payload in blocks of step bytes (a multiple of 3) as (N,3) arrays."""
+    for i in range(0, len(mv), step):
+        # only the last block gets padding
+        pixels, _ = bytes_to_pixels(mv[i:i + step])
+        yield pixels
+
+def write_png_stream(mv: memoryview, step: int, w: int, h: int, path: Path):
+    """Write a minimal 8-bit RGB PNG (IHDR/IDAT.../IEND), filter 0 on every row."""
+    co = zlib.compressobj(1)
+    with open(path, 'wb') as f:
+        f.write(PNG_SIGNATURE)
+        write_png_chunk(f, b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 2, 0, 0, 0))
+        for pixels in iter_pixel_blocks(mv, step):
+            # PNG allows consecutive IDATs: each piece of deflate output becomes a chunk
+            idat = co.compress(png_scanlines(pixels.reshape(-1), w))
+            if idat:
+                write_png_chunk(f, b'IDAT', idat)
+        if not len(mv):
+            # empty payload: the single row declared in IHDR is written as zeros
+            write_png_chunk(f, b'IDAT', co.compress(png_scanlines(np.zeros(w * 3, dtype=np.uint8), w)))
+        write_png_chunk(f, b'IDAT', co.flush())
+        write_png_chunk(f, b'IEND', b'')
+
+def write_hex_stream(mv: memoryview, step: int, path: Path):
+    with open(path, 'wb', buffering=ENCODE_CHUNK) as f:
+        for i, pixels in enumerate(iter_pixel_blocks(mv, step)):
+            if i:
+                f.write(b'\n')
+            f.write(pixels_to_hex_lines(pixels))
+
+def write_wav_stream(mv: memoryview, step: int, nframes: int, path: Path):
     # write WAV: 8-bit unsigned PCM (simple mapping of bytes -> samples)
     # WAV sampwidth 1 expects unsigned bytes (0..255). Good for reversible mapping.
-    with wave.open(str(wav_path), 'wb') as wf:
+    import wave
+    with open(path, 'wb', buffering=ENCODE_CHUNK) as f, wave.open(f, 'wb') as wf:
         wf.setnchannels(1)
         wf.setsampwidth(1)   # 8-bit
         wf.setframerate(44100)  # sample rate arbitrary; user can change later
-        wf.writeframes(pixels.flatten().tobytes())
+        # nframes known up front: the header is right and not rewritten on close
+        wf.setnframes(nframes)
+        for pixels in iter_pixel_blocks(mv, step):
+            wf.writeframesraw(pixels.reshape(-1).data)
+
+def write_outputs(data, base: Path, stem: str):
+    """Write PNG, colors.txt and WAV from data; return (img, hex, wav, w, h, pad).
+
+    Each output walks the payload in ENCODE_CHUNK blocks (whole PNG rows), so
+    working memory is bounded by the block, not the file.
+    The three writers run on a thread pool. zlib deflate, the nogil Numba kernel
+    and file writes release the GIL. The NumPy hex fallback only partly does.
+    """
+    img_path = base / f"{stem}_colors.png"
+    hex_path = base / f"{stem}_colors.txt"
+    wav_path = base / f"{stem}_audio.wav"
+
+    n = len(data)
+    pad = (-n) % 3
+    w, h = image_size((n + pad) // 3)
+    step = max(1, ENCODE_CHUNK // (w * 3)) * w * 3
+    mv = memoryview(data)
+
+    with ThreadPoolExecutor(3) as ex:
+        futures = [
+            ex.submit(write_png_stream, mv, step, w, h, img_path),
+            ex.submit(write_hex_stream, mv, step, hex_path),
+            ex.submit(write_wav_stream, mv, step, n + pad, wav_path),
+        ]
+        for fut in futures:
+            fut.result()
+
+    return img_path, hex_path, wav_path, w, h, pad
+
+def encode_file(path: Path, out_folder: Path, use_zlib: bool = False, use_zstd: bool = False):
+    orig_name = path.name
+    stem = path.stem
+    if use_zlib and use_zstd:
+        raise ValueError("use_zlib and use_zstd are mutually exclusive")
+    src, was_zipped = prepare_input(path)
+    try:
+        orig_size = len(src)
+        data = src
+        codec = "none"
+        # a zipped folder always starts with PK: the magic check only applies to files
+        if not was_zipped and looks_compressed(data):
+            pass  # already compressed: another pass only burns CPU
+        elif use_zstd:
+            comp = zstd_compress(data)
+            if len(comp) < len(data):
+                data = comp
+                codec = "zstd"
+        elif use_zlib:
+            comp = zlib_compress(data)
+            if len(comp) < len(data):
+                data = comp
+                codec = "zlib"
+
+        base = out_folder / stem
+        base.mkdir(parents=True, exist_ok=True)
+        meta_path = base / f"{stem}.meta.json"
+
+        payload = len(data)
+        img_path, hex_path, wav_path, w, h, pad = write_outputs(data, base, stem)
+    finally:
+        if isinstance(src, mmap.mmap):
+            try:
+                src.close()
+            except BufferError:
+                pass  # views still alive (error mid-encode); GC releases it
 
     # save meta
     meta = {
         "orig_name": orig_name,
-        "orig_size_bytes": (zip_temp.stat().st_size if zip_temp else path.stat().st_size),
+        "orig_size_bytes": orig_size,
         "was_zipped": bool(was_zipped),
-        "zlib_used": used_zlib,
+        "codec": codec,
+        "zlib_used": codec == "zlib",
         "pad_bytes": pad,
+        "payload_bytes": payload,
         "image_width": w,
         "image_height": h,
         "files": {
@@ -143,13 +367,6 @@ def encode_file(path: Path, out_folder: Path, use_zlib: bool = False):
     }
     meta_path.write_text(json.dumps(meta, indent=2), encoding='utf-8')
 
-    # cleanup temp zip folder if any
-    if zip_temp:
-        try:
-            shutil.rmtree(zip_temp.parent)
-        except Exception:
-            pass
-
     return img_path, hex_path, wav_path, meta_path
 
 def reconstruct_from_image(img_path: Path, meta_path: Path, out_folder: Path):
@@ -157,13 +374,16 @@ def reconstruct_from_image(img_path: Path, meta_path: Path, out_folder: Path):
     # load meta
     meta = json.loads(meta_path.read_text(encoding='utf-8'))
     pad = int(meta.get("pad_bytes", 0))
-    zlib_used = bool(meta.get("zlib_used", False))
+    codec = meta_codec(meta)
     was_zipped = bool(meta.get("was_zipped", False))
     orig_name = meta.get("orig_name", "reconstructed.bin")
 
+    payload = meta.get("payload_bytes")
+    if payload is not None:
+        # drop the padding pixels at the end of the last row
+        pixels = pixels[:(int(payload) + pad) // 3]
     raw = pixels_to_bytes(pixels, pad)
-    if zlib_used:
-        raw = zlib.decompress(raw)
+    raw = decompress(raw, codec)
     out_name = out_folder / orig_name
     out_name.write_bytes(raw)
 
@@ -172,12 +392,13 @@ def reconstruct_from_image(img_path: Path, meta_path: Path, out_folder: Path):
     return out_name
 
 def reconstruct_from_wav(wav_path: Path, meta_path: Path, out_folder: Path):
+    import wave
     # read wav raw frames
     with wave.open(str(wav_path), 'rb') as r:
         frames = r.readframes(r.getnframes())
     meta = json.loads(meta_path.read_text(encoding='utf-8'))
     pad = int(meta.get("pad_bytes", 0))
-    zlib_used = bool(meta.get("zlib_used", False))
+    codec = meta_codec(meta)
     was_zipped = bool(meta.get("was_zipped", False))
     orig_name = meta.get("orig_name", "reconstructed.bin")
 
@@ -186,8 +407,7 @@ def reconstruct_from_wav(wav_path: Path, meta_path: Path, out_folder: Path):
     # remove padding if any (we don't have pad info maybe; meta stored pad)
     if pad:
         raw = raw[:-pad]
-    if zlib_used:
-        raw = zlib.decompress(raw)
+    raw = decompress(raw, codec)
     out_name = out_folder / orig_name
     out_name.write_bytes(raw)
     return out_name
@@ -195,7 +415,8 @@ def reconstruct_from_wav(wav_path: Path, meta_path: Path, out_folder: Path):
 # -----------------------
 # GUI
 # -----------------------
-def gui_encode():
+def gui_encode(use_z: bool = False, use_zs: bool = False):
+    from tkinter import filedialog, messagebox
     path = filedialog.askopenfilename(title="Selecione arquivo (ou selecione uma pasta)", initialdir=str(Path.home()))
     # allow folder selection via askdirectory if user wants; check if empty string then ask directory
     if not path:
@@ -205,15 +426,15 @@ def gui_encode():
             return
         path = path_dir
     p = Path(path)
-    use_z = var_zlib.get()
     out_folder = get_safe_output_folder()
     try:
-        img, hexf, wavf, meta = encode_file(p, out_folder, use_z)
+        img, hexf, wavf, meta = encode_file(p, out_folder, use_z, use_zs)
         messagebox.showinfo("Encode OK", f"Salvo em:\n{img}\n{hexf}\n{wavf}\n{meta}")
     except Exception as e:
         messagebox.showerror("Erro", str(e))
 
 def gui_reconstruct_from_image():
+    from tkinter import filedialog, messagebox
     img_path = filedialog.askopenfilename(title="Selecione PNG gerado pelo encoder", filetypes=[("PNG","*.png")])
     if not img_path:
         return
@@ -233,6 +454,7 @@ def gui_reconstruct_from_image():
         messagebox.showerror("Erro", str(e))
 
 def gui_reconstruct_from_wav():
+    from tkinter import filedialog, messagebox
     wav_path = filedialog.askopenfilename(title="Selecione WAV gerado pelo encoder", filetypes=[("WAV","*.wav")])
     if not wav_path:
         return
@@ -253,28 +475,40 @@ def gui_reconstruct_from_wav():
 # -----------------------
 # MAIN GUI SETUPa
 # -----------------------
-root = tk.Tk()
-root.title("Game ↔ Colors & Audio Converter")
-root.geometry("420x260")
+def main():
+    import tkinter as tk
+    root = tk.Tk()
+    root.title("Game ↔ Colors & Audio Converter")
+    root.geometry("420x290")
+
+    tk.Label(root, text="Game ↔ Colors & Audio", font=("Segoe UI", 16)).pack(pady=10)
+
+    frame = tk.Frame(root)
+    frame.pack(pady=8)
 
-tk.Label(root, text="Game ↔ Colors & Audio", font=("Segoe UI", 16)).pack(pady=10)
+    btn_encode = tk.Button(frame, text="Encode file/folder → PNG + colors + WAV", width=40, command=lambda: gui_encode(var_codec.get() == "zlib", var_codec.get() == "zstd"))
+    btn_encode.grid(row=0, column=0, padx=8, pady=6, columnspan=2)
 
-frame = tk.Frame(root)
-frame.pack(pady=8)
+    tk.Label(frame, text="Compress before encoding (try if file is large):").grid(row=1, column=0, columnspan=2)
 
-btn_encode = tk.Button(frame, text="Encode file/folder → PNG + colors + WAV", width=40, command=gui_encode)
-btn_encode.grid(row=0, column=0, padx=8, pady=6, columnspan=2)
+    # one codec at a time: radio buttons share a single variable
+    var_codec = tk.StringVar(value="none")
+    codec_frame = tk.Frame(frame)
+    codec_frame.grid(row=2, column=0, columnspan=2, pady=4)
+    tk.Radiobutton(codec_frame, text="None", variable=var_codec, value="none").pack(side=tk.LEFT)
+    tk.Radiobutton(codec_frame, text="zlib", variable=var_codec, value="zlib").pack(side=tk.LEFT)
+    tk.Radiobutton(codec_frame, text="zstd (needs zstandard)", variable=var_codec, value="zstd",
+                   state=(tk.NORMAL if zstandard is not None else tk.DISABLED)).pack(side=tk.LEFT)
 
-var_zlib = tk.BooleanVar(value=False)
-chk_zlib = tk.Checkbutton(frame, text="Apply zlib compression before encoding (try if file is large)", variable=var_zlib)
-chk_zlib.grid(row=1, column=0, columnspan=2, pady=4)
+    btn_recon_img = tk.Button(frame, text="Reconstruct original from PNG", width=40, command=gui_reconstruct_from_image)
+    btn_recon_img.grid(row=3, column=0, padx=8, pady=6, columnspan=2)
 
-btn_recon_img = tk.Button(frame, text="Reconstruct original from PNG", width=40, command=gui_reconstruct_from_image)
-btn_recon_img.grid(row=2, column=0, padx=8, pady=6, columnspan=2)
+    btn_recon_wav = tk.Button(frame, text="Reconstruct original from WAV", width=40, command=gui_reconstruct_from_wav)
+    btn_recon_wav.grid(row=4, column=0, padx=8, pady=6, columnspan=2)
 
-btn_recon_wav = tk.Button(frame, text="Reconstruct original from WAV", width=40, command=gui_reconstruct_from_wav)
-btn_recon_wav.grid(row=3, column=0, padx=8, pady=6, columnspan=2)
+    tk.Label(root, text="Output folder: Pictures/AudioGameConverter", font=("Segoe UI", 9)).pack(pady=8)
 
-tk.Label(root, text="Output folder: Pictures/AudioGameConverter", font=("Segoe UI", 9)).pack(pady=8)
+    root.mainloop()
 
-root.mainloop()
+if __name__ == "__main__":
+    main()